@@ -6,6 +6,7 @@ from open_sea_v1.responses.abc import BaseResponse
 
 
 class BaseEndpoint(ABC):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Optional
 
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
@@ -64,6 +64,7 @@ class AssetsEndpoint(BaseClient, BaseEndpoint):
     owner: Optional[str] = None
     order_by: Optional[AssetsOrderBy] = None
     order_direction: str = None
+    url: ClassVar[str] = EndpointURLS.ASSETS.value
     _response_type = AssetResponse
     _json_resp_key = 'assets'
 
@@ -72,23 +73,19 @@ class AssetsEndpoint(BaseClient, BaseEndpoint):
         if not self.client_params:
             raise AttributeError('Attribute client_params is missing.')
 
-    @property
-    def url(self):
-        return EndpointURLS.ASSETS.value
-
     @property
     def get_params(self) -> dict:
-        return dict(
-            owner=self.owner,
-            token_ids=self.token_ids,
-            asset_contract_address=self.asset_contract_address,
-            asset_contract_addresses=self.asset_contract_addresses,
-            collection=self.collection,
-            order_by=self.order_by,
-            order_direction=self.order_direction,
-            offset=self.client_params.offset,
-            limit=self.client_params.limit,
-        )
+        return {
+            'owner': self.owner,
+            'token_ids': self.token_ids,
+            'asset_contract_address': self.asset_contract_address,
+            'asset_contract_addresses': self.asset_contract_addresses,
+            'collection': self.collection,
+            'order_by': self.order_by,
+            'order_direction': self.order_direction,
+            'offset': self.client_params.offset,
+            'limit': self.client_params.limit,
+        }
 
     @property
     def parsed_http_response(self) -> list[AssetResponse]:
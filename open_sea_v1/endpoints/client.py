@@ -2,20 +2,29 @@ import asyncio
 import logging
 import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from itertools import chain
 from os import environ
-from typing import Optional, Type, Union
+from typing import TYPE_CHECKING, Optional, Type, Union
+from urllib.parse import urlencode
 
-import ujson
-from aiohttp import ClientSession
-from requests.models import PreparedRequest
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup, ujson is always installed.
+    from ujson import loads as json_loads
 
 from open_sea_v1.helpers.rate_limiter import RateLimiter
 from open_sea_v1.responses.abc import BaseResponse
 
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
 logger = logging.getLogger(__name__)
 
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 @dataclass
 class ClientParams:
     """
@@ -62,7 +71,7 @@ class ClientParams:
         self.api_key = environ.get('OPENSEA_API_KEY')
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseClient(ABC):
     """
     This is a partial implementation of a client class.
@@ -83,6 +92,17 @@ class BaseClient(ABC):
         Concurrency limit: number of simultaneous connections at a time.
         Best results obtained by using the largest multiple of _rate_limit, or second largest multiple.
         Otherwise you risk more throttling on the serverside than necessary.
+
+    _pool_maxsize: int
+        Maximum number of keep-alive connections pooled by the session.
+        All pages of a query are fetched through the same pool, so the TLS handshake is only paid once per connection.
+
+    _max_retries: int
+        Number of times a page is re-requested when the server answers with one of the RETRY_STATUSES.
+
+    _retry_backoff_factor: float
+        Sleeps for _retry_backoff_factor * 2 ** attempt seconds between retries,
+        unless the server tells how long to wait with a Retry-After header.
     """
 
     client_params: ClientParams
@@ -90,13 +110,12 @@ class BaseClient(ABC):
 
     _rate_limit: int = 18
     _concurrency_limit: int = 5
+    _pool_maxsize: int = 20
+    _max_retries: int = 3
+    _retry_backoff_factor: float = 0.3
+    _latest_parsed_page: Optional[list[BaseResponse]] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
-        self.processed_pages: int = 0
-        self.response = None
-        self.parsed_http_response = None
-        self._latest_json_response = None
-
         self._rate_limit = 2 if not self.client_params.api_key else self._rate_limit
 
     @property
@@ -107,55 +126,123 @@ class BaseClient(ABC):
 
     @property
     def http_headers(self) -> dict:
-        headers = dict()
+        headers = {'Connection': 'keep-alive'}
         if self.client_params.api_key:
             headers['X-API-Key'] = self.client_params.api_key
         return headers
 
     def get_parsed_pages(self, flat: bool = True) -> list:
         """Dispatches to the correct function depending on whether the user has an API key or not."""
-        if sys.platform == 'win32':
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # prevents closed loops errors on windows
-        self._latest_json_response = None  # reset: required for pagination function
-        results = asyncio.run(self._aget_parsed_pages())
+        self._latest_parsed_page = None  # reset: required for pagination function
+        results = self._run(self._aget_parsed_pages())
         if not flat:
             return results
         flattened = list(chain.from_iterable(results))
         return flattened
 
-    async def _aget_parsed_pages(self) -> list[list[Type[BaseResponse]]]:
-        all_parsed_jsons = list()
+    def fetch_pages(self, offsets: list[int]) -> list[list[BaseResponse]]:
+        """
+        Fetches one page per offset concurrently, instead of walking the pages one after the other.
+        All requests share the same pooled session and remain throttled by the rate limiter.
+        Pages are returned in the same order as the offsets.
+        """
+        return self._run(self._afetch_pages(offsets))
 
-        async with RateLimiter(rate_limit=self._rate_limit, concurrency_limit=self._concurrency_limit) as rate_limiter:
-            async with ClientSession(headers=self.http_headers, json_serialize=ujson.dumps) as session:
-                json_batch = await self._async_get_pages_jsons(session, rate_limiter=rate_limiter)
-                parsed_json_batch = [self._parse_json(j) for j in json_batch]
-                all_parsed_jsons.extend(parsed_json_batch)
+    @staticmethod
+    def _run(coroutine):
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # prevents closed loops errors on windows
+        return asyncio.run(coroutine)
 
-        return all_parsed_jsons
+    async def _aget_parsed_pages(self) -> list[list[Type[BaseResponse]]]:
+        async with RateLimiter(rate_limit=self._rate_limit, concurrency_limit=self._concurrency_limit) as rate_limiter:
+            async with self._mk_session() as session:
+                return await self._async_get_parsed_pages(session, self._mk_base_querystring(), rate_limiter=rate_limiter)
 
-    async def _async_get_pages_jsons(self, session, *, rate_limiter: RateLimiter) -> Optional[list[dict]]:
-        responses = list()
+    async def _afetch_pages(self, offsets: list[int]) -> list[list[Type[BaseResponse]]]:
+        async with RateLimiter(rate_limit=self._rate_limit, concurrency_limit=self._concurrency_limit) as rate_limiter:
+            async with self._mk_session() as session:
+                base_querystring = self._mk_base_querystring()
+                pages_jsons = (
+                    self._async_get_page_json(session, base_querystring, offset, rate_limiter=rate_limiter)
+                    for offset in offsets
+                )
+                json_batch = await asyncio.gather(*pages_jsons)
+        return [self._parse_json(j) for j in json_batch]
+
+    def _mk_session(self) -> 'ClientSession':
+        # aiohttp alone accounts for most of the package's import time, it is only loaded once a query is sent.
+        import ujson
+        from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+        connector = TCPConnector(limit=self._pool_maxsize, limit_per_host=self._pool_maxsize, keepalive_timeout=30)
+        timeout = ClientTimeout(sock_connect=3.05, sock_read=27)
+        return ClientSession(headers=self.http_headers, json_serialize=ujson.dumps, connector=connector, timeout=timeout)
+
+    async def _async_get_parsed_pages(
+            self, session, base_querystring: str, *, rate_limiter: RateLimiter
+    ) -> list[list[Type[BaseResponse]]]:
+        """Pages are parsed once, as soon as they arrive: raw JSON pages are never kept around."""
+        parsed_pages = list()
         processed_pages = 0
         while self._remaining_pages():
 
             self.client_params.offset += self.client_params.page_size
-            params = {**self.get_params, **{'offset': self.client_params.offset}}  # type: ignore
-            querystring = self.mk_querystring(self.url, params=params)
+            json_resp = await self._async_get_page_json(
+                session, base_querystring, self.client_params.offset, rate_limiter=rate_limiter
+            )
+            self._latest_parsed_page = self._parse_json(json_resp)
+            self.client_params._decrement_max_pages_attr()
+            processed_pages += 1
 
-            async with rate_limiter.throttle():
-                resp = await session.get(querystring)
-                json_resp = await resp.json()
-                self._latest_json_response = json_resp
-                self.client_params._decrement_max_pages_attr()
-                processed_pages += 1
+            logger.info(f'Fetched page #{processed_pages} (~{self.client_params.page_size} elements)')
+            parsed_pages.append(self._latest_parsed_page)
 
-            if potential_error_occurred := isinstance(json_resp, dict) and 'detail' in json_resp.keys():
-                raise ConnectionError(f'{(error_msg := json_resp["detail"])}')
+        self._latest_parsed_page = None  # only needed while paginating
+        return parsed_pages
 
-            logger.info(f'Fetched page #{processed_pages} (~{self.client_params.page_size} elements)')
-            responses.append(json_resp)
-        return responses
+    async def _async_get_page_json(
+            self, session, base_querystring: str, offset: int, *, rate_limiter: RateLimiter
+    ) -> Union[dict, list]:
+        querystring = self._mk_page_querystring(base_querystring, offset)
+
+        body = await self._get_with_retries(session, querystring, rate_limiter=rate_limiter)
+        json_resp = json_loads(body)
+
+        if potential_error_occurred := isinstance(json_resp, dict) and 'detail' in json_resp.keys():
+            raise ConnectionError(f'{(error_msg := json_resp["detail"])}')
+        return json_resp
+
+    async def _get_with_retries(self, session, querystring: str, *, rate_limiter: RateLimiter) -> bytes:
+        """
+        Every attempt takes its own rate limiter token, and the backoff is slept outside of the throttle
+        so that a retrying request does not hold on to a concurrency slot.
+        """
+        for attempt in range(self._max_retries + 1):
+            async with rate_limiter.throttle():
+                async with session.get(querystring) as resp:  # releases the connection and its buffer
+                    if resp.status not in RETRY_STATUSES:
+                        return await resp.read()
+                    if attempt == self._max_retries:
+                        body_excerpt = (await resp.text())[:200]
+                        raise ConnectionError(f'HTTP {resp.status} after {self._max_retries} retries: {body_excerpt}')
+                    retry_after = resp.headers.get('Retry-After')
+            logger.debug(f'Got HTTP {resp.status}, retrying ({attempt + 1}/{self._max_retries}).')
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Honours the Retry-After header (seconds or HTTP date) when present, like urllib3's Retry does."""
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                logger.debug(f'Ignoring unparsable Retry-After header: {retry_after!r}')
+        return self._retry_backoff_factor * 2 ** attempt
 
     def _parse_json(self, the_json: Union[dict, list]) -> list[Type[BaseResponse]]:
         if not the_json:
@@ -168,21 +255,36 @@ class BaseClient(ABC):
             flattened = list(chain.from_iterable(the_json)) if isinstance(the_json[0], list) else the_json  # just in case multiple pages
             json_list = list(chain.from_iterable(j.get(self._json_resp_key) or [j] for j in flattened))
 
-        responses = [self._response_type(element) for element in json_list]  # type: ignore
+        responses = list(map(self._response_type, json_list))  # type: ignore
         return responses
 
     def _remaining_pages(self) -> bool:
-        if self._latest_json_response is None:
+        if self._latest_parsed_page is None:
             return True
-        if is_the_last_page := len(self._parse_json(self._latest_json_response)) < self.client_params.page_size:
+        if is_the_last_page := len(self._latest_parsed_page) < self.client_params.page_size:
             return False
         max_pages_reached: bool = self.client_params.max_pages is not None and self.client_params.max_pages <= 0
         if max_pages_reached:
             return False
         return True
 
+    def _mk_base_querystring(self) -> str:
+        """
+        Only the offset changes from one page to the next: every other param is encoded once per run,
+        and the offset gets appended to the result for each page.
+        """
+        params = {k: v for k, v in self.get_params.items() if k != 'offset'}  # type: ignore
+        return self.mk_querystring(self.url, params=params)
+
+    @staticmethod
+    def _mk_page_querystring(base_querystring: str, offset: int) -> str:
+        separator = '&' if '?' in base_querystring else '?'
+        return f'{base_querystring}{separator}offset={offset}'
+
     @staticmethod
     def mk_querystring(url, params) -> str:
-        url_prepper = PreparedRequest()
-        url_prepper.prepare_url(url, params)
-        return url_prepper.url
\ No newline at end of file
+        querystring = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
+        if not querystring:
+            return url
+        separator = '&' if '?' in url else '?'
+        return f'{url}{separator}{querystring}'
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
@@ -38,6 +38,7 @@ class CollectionsEndpoint(BaseClient, BaseEndpoint):
 
     client_params: ClientParams = None
     asset_owner: Optional[str] = None
+    url: ClassVar[str] = EndpointURLS.COLLECTIONS.value
     _response_type = CollectionResponse
     _json_resp_key = 'collections'
 
@@ -46,17 +47,13 @@ class CollectionsEndpoint(BaseClient, BaseEndpoint):
         if not self.client_params:
             raise AttributeError('Attribute client_params is missing.')
 
-    @property
-    def url(self):
-        return EndpointURLS.COLLECTIONS.value
-
     @property
     def get_params(self) -> dict:
-        return dict(
-            asset_owner=self.asset_owner,
-            offset=self.client_params.offset,
-            limit=self.client_params.limit,
-        )
+        return {
+            'asset_owner': self.asset_owner,
+            'offset': self.client_params.offset,
+            'limit': self.client_params.limit,
+        }
 
     def _validate_request_params(self) -> None:
         if self.asset_owner is not None and not isinstance(self.asset_owner, str):
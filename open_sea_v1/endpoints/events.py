@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import ClassVar, Optional
 
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
@@ -31,7 +32,10 @@ class AuctionType(ExtendedStrEnum):
     MIN_PRICE = 'min-price'
 
 
-@dataclass
+_OCCURRED_TYPES = (type(None), datetime)
+
+
+@dataclass(slots=True)
 class EventsEndpoint(BaseClient, BaseEndpoint):
     """
     The events endpoint provides a list of events that occur on the assets that OpenSea tracks.
@@ -74,6 +78,7 @@ class EventsEndpoint(BaseClient, BaseEndpoint):
     event_type: EventType = None
     auction_type: Optional[AuctionType] = None
     only_opensea: bool = False
+    url: ClassVar[str] = EndpointURLS.EVENTS.value
     _response_type = EventResponse
     _json_resp_key = 'asset_events'
 
@@ -82,75 +87,99 @@ class EventsEndpoint(BaseClient, BaseEndpoint):
         if not self.client_params:
             raise AttributeError('Attribute client_params is missing.')
 
-    @property
-    def url(self) -> str:
-        return EndpointURLS.EVENTS.value
-
     @property
     def get_params(self) -> dict:
-        return dict(
-            offset=self.client_params.offset,
-            limit=self.client_params.limit,
-            asset_contract_address=self.asset_contract_address,
-            event_type=self.event_type,
-            only_opensea=self.only_opensea,
-            collection_slug=self.collection_slug,
-            token_id=self.token_id,
-            account_address=self.account_address,
-            auction_type=self.auction_type,
-            occurred_before=self.occurred_before,
-            occurred_after=self.occurred_after,
-        )
+        params = {
+            'offset': self.client_params.offset,
+            'limit': self.client_params.limit,
+            'asset_contract_address': self.asset_contract_address,
+            'event_type': self.event_type,
+            'only_opensea': self.only_opensea,
+            'collection_slug': self.collection_slug,
+            'token_id': self.token_id,
+            'account_address': self.account_address,
+            'auction_type': self.auction_type,
+            'occurred_before': self.occurred_before and self.occurred_before.isoformat(),
+            'occurred_after': self.occurred_after and self.occurred_after.isoformat(),
+        }
+        return {k: v for k, v in params.items() if v is not None}
 
     def _validate_request_params(self) -> None:
-        self._validate_param_auction_type()
-        self._validate_param_event_type()
-        self._validate_params_occurred_before_and_occurred_after()
-
-    def _validate_param_event_type(self) -> None:
-        if self.event_type is None:
+        params = self.event_type, self.auction_type, self.occurred_before, self.occurred_after
+        try:
+            hash(params)
+        except TypeError:  # cannot be a cache key, let the validators raise their descriptive errors instead
+            self._validate_params(*params)
+            return
+        self._cached_validate(*params)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_validate(event_type, auction_type, occurred_before, occurred_after) -> None:
+        """
+        Memoized on the validated params only: endpoints rebuilt with the same filters,
+        for instance to walk different offsets, skip validation altogether.
+        Exceptions are never cached, invalid params raise on every call.
+        """
+        EventsEndpoint._validate_params(event_type, auction_type, occurred_before, occurred_after)
+
+    @staticmethod
+    def _validate_params(event_type, auction_type, occurred_before, occurred_after) -> None:
+        EventsEndpoint._validate_param_auction_type(auction_type)
+        EventsEndpoint._validate_param_event_type(event_type)
+        EventsEndpoint._validate_params_occurred_before_and_occurred_after(occurred_before, occurred_after)
+
+    @staticmethod
+    def _validate_param_event_type(event_type) -> None:
+        if event_type is None:
             return
 
-        if not isinstance(self.event_type, (str, EventType)):
-            raise TypeError('Invalid event_type type. Must be str or EventType Enum.', f"{self.event_type=}")
+        if not isinstance(event_type, str):
+            raise TypeError('Invalid event_type type. Must be str or EventType Enum.', f"{event_type=}")
 
-        if self.event_type not in EventType.list():
-            raise ValueError('Invalid event_type value. Must be str value from EventType Enum.', f"{self.event_type=}")
+        if event_type not in EventType.set():
+            raise ValueError('Invalid event_type value. Must be str value from EventType Enum.', f"{event_type=}")
 
-    def _validate_param_auction_type(self) -> None:
-        if self.auction_type is None:
+    @staticmethod
+    def _validate_param_auction_type(auction_type) -> None:
+        if auction_type is None:
             return
 
-        if not isinstance(self.auction_type, (str, AuctionType)):
-            raise TypeError('Invalid auction_type type. Must be str or AuctionType Enum.', f"{self.auction_type=}")
+        if not isinstance(auction_type, str):
+            raise TypeError('Invalid auction_type type. Must be str or AuctionType Enum.', f"{auction_type=}")
 
-        if self.auction_type not in AuctionType.list():
+        if auction_type not in AuctionType.set():
             raise ValueError('Invalid auction_type value. Must be str value from AuctionType Enum.',
-                             f"{self.auction_type=}")
-
-    def _validate_params_occurred_before_and_occurred_after(self) -> None:
-        self._validate_param_occurred_before()
-        self._validate_param_occurred_after()
-        if self.occurred_after and self.occurred_before:
-            self._assert_param_occurred_before_after_cannot_be_same_value()
-            self._assert_param_occurred_before_cannot_be_higher_than_occurred_after()
-
-    def _validate_param_occurred_before(self) -> None:
-        if not isinstance(self.occurred_before, (type(None), datetime)):
+                             f"{auction_type=}")
+
+    @staticmethod
+    def _validate_params_occurred_before_and_occurred_after(occurred_before, occurred_after) -> None:
+        EventsEndpoint._validate_param_occurred_before(occurred_before)
+        EventsEndpoint._validate_param_occurred_after(occurred_after)
+        if occurred_after and occurred_before:
+            EventsEndpoint._assert_param_occurred_before_after_cannot_be_same_value(occurred_before, occurred_after)
+            EventsEndpoint._assert_param_occurred_before_cannot_be_higher_than_occurred_after(occurred_before, occurred_after)
+
+    @staticmethod
+    def _validate_param_occurred_before(occurred_before) -> None:
+        if not isinstance(occurred_before, _OCCURRED_TYPES):
             raise TypeError('Invalid occurred_before type. Must be instance of datetime.',
-                            f'{type(self.occurred_before)=}')
+                            f'{type(occurred_before)=}')
 
-    def _validate_param_occurred_after(self) -> None:
-        if not isinstance(self.occurred_after, (type(None), datetime)):
+    @staticmethod
+    def _validate_param_occurred_after(occurred_after) -> None:
+        if not isinstance(occurred_after, _OCCURRED_TYPES):
             raise TypeError('Invalid occurred_after type. Must be instance of datetime.',
-                            f'{type(self.occurred_after)=}')
+                            f'{type(occurred_after)=}')
 
-    def _assert_param_occurred_before_after_cannot_be_same_value(self) -> None:
-        if self.occurred_after == self.occurred_before:
+    @staticmethod
+    def _assert_param_occurred_before_after_cannot_be_same_value(occurred_before, occurred_after) -> None:
+        if occurred_after == occurred_before:
             raise ValueError('Params occurred_after and occurred_before may not have the same value.',
-                             f"{self.occurred_before=}, {self.occurred_after=}")
+                             f"{occurred_before=}, {occurred_after=}")
 
-    def _assert_param_occurred_before_cannot_be_higher_than_occurred_after(self) -> None:
-        if not self.occurred_after < self.occurred_before:
+    @staticmethod
+    def _assert_param_occurred_before_cannot_be_higher_than_occurred_after(occurred_before, occurred_after) -> None:
+        if not occurred_after < occurred_before:
             raise ValueError('Param occurred_before cannot be higher than param occurred_after.',
-                             f"{self.occurred_before=}, {self.occurred_after=}")
\ No newline at end of file
+                             f"{occurred_before=}, {occurred_after=}")
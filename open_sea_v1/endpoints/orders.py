@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import ClassVar
 
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
@@ -102,39 +103,36 @@ class OrdersEndpoint(BaseClient, BaseEndpoint):
     sale_kind: int = None
     order_by: str = None
     order_direction: str = None
+    url: ClassVar[str] = EndpointURLS.ORDERS.value
     _response_type = OrderResponse
     _json_resp_key = 'orders'
 
     def __post_init__(self):
         self._validate_request_params()
 
-    @property
-    def url(self):
-        return EndpointURLS.ORDERS.value
-
     @property
     def get_params(self) -> dict:
-        return dict(
-            asset_contract_address=self.asset_contract_address,
-            payment_token_address=self.payment_token_address,
-            maker=self.maker,
-            taker=self.taker,
-            owner=self.owner,
-            is_english=self.is_english,
-            bundled=self.bundled,
-            include_bundled=self.include_bundled,
-            include_invalid=self.include_invalid,
-            listed_after=self.listed_after,
-            listed_before=self.listed_before,
-            token_id=self.token_id,
-            token_ids=self.token_ids,
-            side=self.side,
-            sale_kind=self.sale_kind,
-            limit=self.client_params.limit,
-            offset=self.client_params.offset,
-            order_by=self.order_by,
-            order_direction=self.order_direction,
-        )
+        return {
+            'asset_contract_address': self.asset_contract_address,
+            'payment_token_address': self.payment_token_address,
+            'maker': self.maker,
+            'taker': self.taker,
+            'owner': self.owner,
+            'is_english': self.is_english,
+            'bundled': self.bundled,
+            'include_bundled': self.include_bundled,
+            'include_invalid': self.include_invalid,
+            'listed_after': self.listed_after,
+            'listed_before': self.listed_before,
+            'token_id': self.token_id,
+            'token_ids': self.token_ids,
+            'side': self.side,
+            'sale_kind': self.sale_kind,
+            'limit': self.client_params.limit,
+            'offset': self.client_params.offset,
+            'order_by': self.order_by,
+            'order_direction': self.order_direction,
+        }
 
     def _validate_request_params(self) -> None:
         self._validate_contract_address_defined_with_token_id_or_tokens_ids()
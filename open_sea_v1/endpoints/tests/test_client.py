@@ -1,8 +1,12 @@
 from os import environ
-from unittest import TestCase, skipIf
+from unittest import IsolatedAsyncioTestCase, TestCase, skipIf
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from open_sea_v1.endpoints.client import ClientParams
 from open_sea_v1.endpoints.events import EventsEndpoint, EventType
+from open_sea_v1.helpers.rate_limiter import RateLimiter
 from open_sea_v1.responses.event import EventResponse
 from open_sea_v1.tests.run_tests import SKIP_SLOW_TESTS
 
@@ -21,6 +25,72 @@ class TestClientParams(TestCase):
         self.assertRaises(ValueError, ClientParams, page_size=51)
 
 
+class TestBaseClientQuerystring(TestCase):
+
+    def test_mk_querystring_skips_none_values(self):
+        querystring = EventsEndpoint.mk_querystring('https://example.com/events', {'a': None, 'b': 1})
+        self.assertEqual('https://example.com/events?b=1', querystring)
+
+    def test_mk_querystring_extends_an_existing_query(self):
+        querystring = EventsEndpoint.mk_querystring('https://example.com/events?a=1', {'limit': 2})
+        self.assertEqual('https://example.com/events?a=1&limit=2', querystring)
+
+    def test_mk_querystring_returns_url_unchanged_without_params(self):
+        self.assertEqual('https://example.com/events', EventsEndpoint.mk_querystring('https://example.com/events', {}))
+
+
+class TestBaseClientRetryDelay(TestCase):
+
+    def setUp(self) -> None:
+        self.client = EventsEndpoint(client_params=ClientParams(), _retry_backoff_factor=0.3)  # type: ignore
+
+    def test_retry_delay_uses_retry_after_header_when_present(self):
+        self.assertEqual(2.5, self.client._retry_delay(attempt=0, retry_after='2.5'))
+        self.assertEqual(0.0, self.client._retry_delay(attempt=0, retry_after='Wed, 21 Oct 2015 07:28:00 GMT'))
+
+    def test_retry_delay_backs_off_exponentially_without_retry_after_header(self):
+        self.assertEqual([0.3, 0.6, 1.2], [self.client._retry_delay(attempt, None) for attempt in range(3)])
+
+
+class TestBaseClientRetries(IsolatedAsyncioTestCase):
+    """Runs against a local server answering with the given statuses, in order, then with an empty page."""
+
+    async def asyncSetUp(self) -> None:
+        self.statuses = list()
+        self.hits = 0
+        app = web.Application()
+        app.router.add_get('/events', self._handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.client = EventsEndpoint(client_params=ClientParams(), _retry_backoff_factor=0)  # type: ignore
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def _handler(self, request) -> web.Response:
+        self.hits += 1
+        if self.statuses:
+            return web.Response(status=self.statuses.pop(0), text='Too many requests', headers={'Retry-After': '0'})
+        return web.json_response({'asset_events': []})
+
+    async def get_page_json(self):
+        base_querystring = str(self.server.make_url('/events'))
+        async with RateLimiter(rate_limit=100, concurrency_limit=1) as rate_limiter:
+            async with self.client._mk_session() as session:
+                return await self.client._async_get_page_json(session, base_querystring, 0, rate_limiter=rate_limiter)
+
+    async def test_retries_throttled_requests_until_success(self):
+        self.statuses = [429, 503]
+        self.assertEqual({'asset_events': []}, await self.get_page_json())
+        self.assertEqual(3, self.hits)
+
+    async def test_raises_connection_error_once_retries_are_exhausted(self):
+        self.statuses = [429] * (self.client._max_retries + 1)
+        with self.assertRaisesRegex(ConnectionError, 'HTTP 429'):
+            await self.get_page_json()
+        self.assertEqual(self.client._max_retries + 1, self.hits)
+
+
 class TestBaseEndpointClient(TestCase):
 
     @classmethod
@@ -42,8 +112,8 @@ class TestBaseEndpointClient(TestCase):
     def mk_events_endpoint(cls) -> EventsEndpoint:
         return EventsEndpoint(**cls.sample_client_kwargs)  # type: ignore
 
-    def test_remaining_pages_true_if_json_resp_is_none(self):
-        self.sample_client._latest_json_response = None
+    def test_remaining_pages_true_if_latest_parsed_page_is_none(self):
+        self.sample_client._latest_parsed_page = None
         self.assertTrue(self.sample_client._remaining_pages())
 
     def test_get_pages_does_not_append_empty_pages(self):
@@ -73,6 +143,17 @@ class TestBaseEndpointClient(TestCase):
         # print(resp_2_ids)
         self.assertEqual(resp_1_ids[-1], resp_2_ids[-1])
 
+    def test_fetch_pages_returns_pages_in_the_same_order_as_offsets(self):
+        # get_parsed_pages increments the offset by page_size before each request,
+        # so starting from offset=0 the two sequential pages are fetched at offsets 1 and 2.
+        self.sample_client.client_params = ClientParams(limit=1, offset=0, page_size=1, max_pages=2)
+        sequential_ids = [[e.id for e in page] for page in self.sample_client.get_parsed_pages(flat=False)]
+
+        self.sample_client.client_params = ClientParams(limit=1, page_size=1)
+        pages = self.sample_client.fetch_pages([2, 1])
+        fetched_ids = [[e.id for e in page] for page in pages]
+        self.assertEqual(sequential_ids[::-1], fetched_ids)
+
 
 @skipIf(not environ.get('OPENSEA_API_KEY'), "No OPENSEA_API_KEY detected within system environment variables.")
 class TestBaseClientAsyncWithAPIKey(TestCase):
@@ -25,6 +25,10 @@ class TestEventsEndpoint(QueryTestCase):
         updated_kwargs = self.events_default_kwargs | dict(event_type='randomstr')
         self.assertRaises((ValueError, TypeError), self.create_and_get, **updated_kwargs)
 
+    def test_param_event_type_raises_descriptive_type_error_if_unhashable(self):
+        updated_kwargs = self.events_default_kwargs | dict(event_type=[EventType.SUCCESSFUL, EventType.CREATED])
+        self.assertRaisesRegex(TypeError, 'Invalid event_type type', self.create_and_get, **updated_kwargs)
+
     def test_param_auction_type_filters_properly(self):
         new_client_params = ClientParams(limit=5, page_size=5, max_pages=1)
         updated_kwargs = self.events_default_kwargs | dict(client_params=new_client_params, auction_type=AuctionType.DUTCH)
@@ -85,7 +89,8 @@ class TestEventsEndpoint(QueryTestCase):
         updated_kwargs = self.events_default_kwargs | dict(occurred_after=occurred_after, client_params=new_client_params)
         events = self.create_and_get(**updated_kwargs)
         transaction_datetimes = [datetime.fromisoformat(event.transaction['timestamp']) for event in events]
-        self.assertTrue(all(trans_date >= occurred_after for trans_date in transaction_datetimes))
+        for trans_date in transaction_datetimes:
+            self.assertGreaterEqual(trans_date, occurred_after)
 
     def test_param_occurred_before_filters_properly(self):
         occurred_before = datetime(year=2021, month=8, day=1)
@@ -93,7 +98,8 @@ class TestEventsEndpoint(QueryTestCase):
         updated_kwargs = self.events_default_kwargs | dict(occurred_before=occurred_before, client_params=new_client_params)
         events = self.create_and_get(**updated_kwargs)
         transaction_datetimes = [datetime.fromisoformat(event.transaction['timestamp']) for event in events]
-        self.assertTrue(all(trans_date < occurred_before for trans_date in transaction_datetimes))
+        for trans_date in transaction_datetimes:
+            self.assertLess(trans_date, occurred_before)
 
     def test_params_occurred_before_after_work_together(self):
         occurred_after = datetime(year=2021, month=7, day=30)
@@ -103,4 +109,6 @@ class TestEventsEndpoint(QueryTestCase):
         updated_kwargs = self.events_default_kwargs | kwargs
         events = self.create_and_get(**updated_kwargs)
         transaction_datetimes = [datetime.fromisoformat(event.transaction['timestamp']) for event in events]
-        self.assertTrue(all(occurred_after <= trans_date <= occurred_before for trans_date in transaction_datetimes))
\ No newline at end of file
+        for trans_date in transaction_datetimes:
+            self.assertGreaterEqual(trans_date, occurred_after)
+            self.assertLessEqual(trans_date, occurred_before)
\ No newline at end of file
@@ -1,9 +1,20 @@
 from enum import Enum
+from functools import cache
 
 
 class ExtendedStrEnum(str, Enum):
-    """Adds list method which will list all values associated with children instances."""
+    """Adds list and set methods which will return all values associated with children instances."""
+
+    __str__ = str.__str__  # members are their own value when stringified or url-encoded
+
+    @classmethod
+    @cache
+    def list(cls) -> tuple[str, ...]:
+        """Values of each member, computed once per enum class."""
+        return tuple(m.value for m in cls)
 
     @classmethod
-    def list(cls) -> list[str]:
-        return list(map(lambda c: c.value, cls))
+    @cache
+    def set(cls) -> frozenset[str]:
+        """Cached set of values, for O(1) membership checks."""
+        return frozenset(cls.list())
@@ -3,6 +3,7 @@ from abc import ABC
 
 class BaseResponse(ABC):
     """Parent class for OpenSea API Responses."""
+    __slots__ = ('_json',)
 
     def __init__(self, _json: dict = None):
         self._json = _json
@@ -11,6 +11,11 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class EventResponse(BaseResponse):
+    __slots__ = (
+        'approved_account', 'asset_bundle', 'auction_type', 'collection_slug', 'contract_address', 'created_date',
+        'custom_event_name', 'dev_fee_payment_event', 'duration', 'ending_price', 'event_type', 'from_account', 'id',
+        'owner_account', 'quantity', 'starting_price', 'to_account', 'total_price', 'bid_amount', 'is_private',
+    )
     _json: dict
 
     def __str__(self) -> str:
@@ -12,7 +12,7 @@ setup(
     name='opensea_api_wrapper',
     author='COJEAN Kévin',
     author_email='digitalexmachina+openseaapiwrapper@gmail.com',
-    python_requires='>=3.9',
+    python_requires='>=3.10',
     install_requires=read_requirements_txt(),
     packages=find_packages(),
 )
\ No newline at end of file